@@ -9,36 +9,240 @@ Usage:
     python watch_scraper.py --all --output watches_all.json
     python watch_scraper.py --pages 1 5 --output watches_1_to_5.json
     python watch_scraper.py --page 1 --output watches_page_1.json
+
+Requirements:
+    pip install requests requests-cache lxml selectolax orjson
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession, SQLiteCache
+from selectolax.lexbor import LexborHTMLParser
+from lxml import etree
+from lxml import html as lxml_html
 import json
+import orjson
 import argparse
+import functools
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Known brands as a single anchored alternation - order matters (longer brands first)
+_BRAND_RE = re.compile(
+    r'^(Audemars Piguet|Patek Philippe|Vacheron Constantin|A\. Lange & Söhne|Franck Muller|Bell & Ross|'
+    r'Tag Heuer|Jaeger-LeCoultre|Omega|Rolex|Tudor|Cartier|Hublot|Breitling|Panerai|IWC|Zenith|'
+    r'Montblanc|Longines|Tissot|Seiko|Casio|Citizen)',
+    re.IGNORECASE,
+)
+
+_PRICE_RE = re.compile(r'SGD\s*([\d,]+)')
+_YEAR4_RE = re.compile(r'(\d{4})')
+_PAGE_RE = re.compile(r'/page/(\d+)/')
+_COUNT_RE = re.compile(r'(\d+)\s*Pre-owned watches')
+# Common year phrasings in free page text, combined so the text is scanned once
+_YEAR_CTX_RE = re.compile(
+    '|'.join([
+        r'Year[:\s]*(\d{4})',
+        r'(\d{4})\s*model',
+        r'circa\s*(\d{4})',
+        r'manufactured\s*in\s*(\d{4})',
+        r'production\s*year[:\s]*(\d{4})',
+    ]),
+    re.IGNORECASE,
+)
+# Product page containers worth scanning for a year; the rest of the DOM is navigation and boilerplate
+_YEAR_TEXT_SELECTOR = ', '.join([
+    '.entry-summary',
+    '.woocommerce-product-details__short-description',
+    '.product-description',
+    '.summary',
+    'table.shop_attributes',
+])
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """
+    Build an XPath step matching tag elements that carry class_name among their classes
+    """
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+# Listing pages are read with lxml directly and product pages with selectolax
+_PRODUCT_XPATH = etree.XPath('//' + _class_xpath('li', 'latest-single-product'))
+_LOAD_MORE_XPATH = etree.XPath('//' + _class_xpath('a', 'lmp_button'))
+_RESULT_COUNT_XPATH = etree.XPath('//' + _class_xpath('h1', 'woocommerce-result-count'))
+
+# Listing product fields by tag: (field name, class the element must carry or None)
+_LISTING_FIELDS = {
+    'a': ('link', 'woocommerce-LoopProduct-link'),
+    'h2': ('brand_model', None),
+    'h3': ('reference', None),
+    'div': ('condition', 'pre-owned-cus'),
+    'span': ('price', 'woocommerce-Price-amount'),
+}
+
+def _find_listing_fields(product_element) -> Dict:
+    """
+    Collect the first element for each listing field in a single depth-first pass
+    """
+    found = {}
+    for element in product_element.iter(*_LISTING_FIELDS):
+        field, class_name = _LISTING_FIELDS[element.tag]
+        if field in found or (class_name and class_name not in element.get('class', '').split()):
+            continue
+        found[field] = element
+        if len(found) == len(_LISTING_FIELDS):
+            break
+    return found
+
+def _element_text(element) -> str:
+    """
+    Concatenate an lxml element's stripped text nodes (BeautifulSoup's get_text(strip=True) equivalent)
+    """
+    return ''.join(text.strip() for text in element.itertext())
+
+@functools.lru_cache(maxsize=1024)
+def _main_brand_name(full_brand_text: str) -> str:
+    """
+    Memoized implementation of WatchScraper.extract_main_brand_name; listing titles repeat heavily
+    """
+    if not full_brand_text:
+        return full_brand_text
+    
+    match = _BRAND_RE.match(full_brand_text)
+    if match:
+        brand_name = match.group(1)
+        # Return in proper case for multi-word brands, uppercase for single words
+        if ' ' in brand_name:
+            return brand_name  # Keep original case for multi-word brands
+        else:
+            return brand_name.upper()  # Uppercase for single word brands
+    
+    # If no pattern matches, extract first word and uppercase it
+    # split(None, 1) stops at the first whitespace run instead of tokenizing the whole title
+    parts = full_brand_text.split(None, 1)
+    first_word = parts[0] if parts else full_brand_text
+    return first_word.upper()
+
+def _response_encoding(response: requests.Response) -> str:
+    """
+    Charset declared in the response headers, else the one detected from the body
+    """
+    # requests reports ISO-8859-1 for any text/* response without a charset, so only trust a declared one
+    if 'charset' in response.headers.get('Content-Type', '').lower() and response.encoding:
+        return response.encoding
+    return response.apparent_encoding or 'utf-8'
+
+def _load_json(text: str):
+    """
+    Parse JSON with orjson, falling back to the stdlib for the NaN/Infinity literals orjson rejects
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+class RateLimiter:
+    def __init__(self, delay: float, burst: int = 1):
+        """
+        Token bucket shared by all threads, earning one token every delay seconds
+        
+        Args:
+            delay: Interval between tokens in seconds (0 disables limiting)
+            burst: Maximum number of tokens that can accumulate while idle
+        """
+        self.delay = delay
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+    
+    def wait(self):
+        """
+        Block until a token is available and consume it
+        """
+        if self.delay <= 0:
+            return
+        while True:
+            with self._lock:
+                # Refill lazily from the elapsed time instead of running a background thread
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) / self.delay)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) * self.delay
+            time.sleep(wait_time)
+
 class WatchScraper:
-    def __init__(self, base_url: str = "https://watchexchange.sg/watches/", delay: float = 1.0):
+    def __init__(self, base_url: str = "https://watchexchange.sg/watches/", delay: float = 1.0, max_workers: int = 8,
+                 cache_name: Optional[str] = 'wx_cache', cache_expire_after: int = 3600):
         """
         Initialize the scraper
         
         Args:
             base_url: Base URL for the watch listing
             delay: Delay between requests in seconds
+            max_workers: Number of threads used to fetch product detail pages
+            cache_name: SQLite response cache path (without extension), or None to disable caching
+            cache_expire_after: Seconds before a cached response is revalidated with the server
         """
         self.base_url = base_url
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(delay)
+        # One pooled, retrying adapter shared by every thread's session keeps keep-alive connections warm
+        self.adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+            ),
+        )
+        # Every thread's session reads and writes the same on-disk cache, so reruns avoid the network
+        self.cache = SQLiteCache(cache_name) if cache_name else None
+        self.cache_expire_after = cache_expire_after
+        # requests.Session is not guaranteed to be thread-safe, so each worker gets its own
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        Session belonging to the calling thread, created on first use
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+        return session
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Build a session with browser-like default headers
+        
+        Returns:
+            Configured requests.Session (a CachedSession when caching is enabled) sharing the scraper's connection pool
+        """
+        if self.cache is not None:
+            session = CachedSession(backend=self.cache, expire_after=self.cache_expire_after)
+        else:
+            session = requests.Session()
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
@@ -46,33 +250,64 @@ class WatchScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        return session
     
-    def get_page(self, url: str, retry_count: int = 3) -> Optional[BeautifulSoup]:
+    def fetch(self, url: str) -> Optional[requests.Response]:
         """
-        Fetch and parse a page with retry logic
+        Fetch a page (retries are handled by the session adapter)
         
         Args:
             url: URL to fetch
-            retry_count: Number of retries
             
         Returns:
-            BeautifulSoup object or None if failed
+            Successful response or None if failed
         """
-        for attempt in range(retry_count):
-            try:
-                logger.info(f"Fetching: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
-            except requests.RequestException as e:
-                logger.warning(f"Error fetching {url} (attempt {attempt + 1}): {e}")
-                if attempt < retry_count - 1:
-                    wait_time = (attempt + 1) * 2
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Failed to fetch {url} after {retry_count} attempts")
-        return None
+        try:
+            session = self.session
+            response = None
+            if self.cache is not None:
+                # Fresh cache hits are local reads and don't need a rate limiter token; misses come back as 504
+                response = session.get(url, timeout=30, only_if_cached=True)
+                if response.status_code == 504:
+                    response = None
+            if response is None:
+                self.rate_limiter.wait()
+                logger.info(f"Fetching: {url}")
+                response = session.get(url, timeout=30)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+    
+    def get_listing_tree(self, page_num: int) -> Optional[lxml_html.HtmlElement]:
+        """
+        Fetch and parse a listing page
+        
+        Args:
+            page_num: Page number to fetch
+            
+        Returns:
+            lxml root element or None if failed
+        """
+        if page_num == 1:
+            url = self.base_url
+        else:
+            url = f"{self.base_url}page/{page_num}/"
+        
+        response = self.fetch(url)
+        if response is None or not response.content:
+            return None
+        
+        # Decode with the charset the server declares; without one libxml2 would assume latin-1
+        parser = lxml_html.HTMLParser(encoding=_response_encoding(response))
+        try:
+            tree = lxml_html.fromstring(response.content, parser=parser)
+        except etree.ParserError as e:
+            # e.g. a body holding only whitespace or a comment
+            logger.error(f"Failed to parse {url}: {e}")
+            return None
+        return tree
     
     def extract_main_brand_name(self, full_brand_text: str) -> str:
         """
@@ -84,56 +319,14 @@ class WatchScraper:
         Returns:
             Main brand name (e.g., "ROLEX")
         """
-        if not full_brand_text:
-            return full_brand_text
-        
-        # Define brand patterns - order matters (longer brands first)
-        brand_patterns = [
-            r'^Audemars Piguet',
-            r'^Patek Philippe', 
-            r'^Vacheron Constantin',
-            r'^A\. Lange & Söhne',
-            r'^Franck Muller',
-            r'^Bell & Ross',
-            r'^Tag Heuer',
-            r'^Jaeger-LeCoultre',
-            r'^Omega',
-            r'^Rolex',
-            r'^Tudor',
-            r'^Cartier',
-            r'^Hublot',
-            r'^Breitling',
-            r'^Panerai',
-            r'^IWC',
-            r'^Zenith',
-            r'^Montblanc',
-            r'^Longines',
-            r'^Tissot',
-            r'^Seiko',
-            r'^Casio',
-            r'^Citizen',
-        ]
-        
-        for pattern in brand_patterns:
-            match = re.search(pattern, full_brand_text, re.IGNORECASE)
-            if match:
-                brand_name = match.group(0)
-                # Return in proper case for multi-word brands, uppercase for single words
-                if ' ' in brand_name:
-                    return brand_name  # Keep original case for multi-word brands
-                else:
-                    return brand_name.upper()  # Uppercase for single word brands
-        
-        # If no pattern matches, extract first word and uppercase it
-        first_word = full_brand_text.split()[0] if full_brand_text.split() else full_brand_text
-        return first_word.upper()
+        return _main_brand_name(full_brand_text)
 
     def extract_product_basic_info(self, product_element) -> Dict:
         """
         Extract basic product information from listing page
         
         Args:
-            product_element: BeautifulSoup element containing product data
+            product_element: lxml element containing product data
             
         Returns:
             Dictionary with basic product information
@@ -141,36 +334,38 @@ class WatchScraper:
         product_data = {}
         
         try:
+            fields = _find_listing_fields(product_element)
+            
             # Extract product URL
-            link_elem = product_element.find('a', class_='woocommerce-LoopProduct-link')
-            if link_elem:
+            link_elem = fields.get('link')
+            if link_elem is not None:
                 product_data['product_url'] = link_elem.get('href', '')
             
             # Extract brand and model from h2 tag
-            brand_model_elem = product_element.find('h2')
-            if brand_model_elem:
-                brand_model_text = brand_model_elem.get_text(strip=True)
+            brand_model_elem = fields.get('brand_model')
+            if brand_model_elem is not None:
+                brand_model_text = _element_text(brand_model_elem)
                 # Extract main brand name only
                 product_data['brand'] = self.extract_main_brand_name(brand_model_text)
                 # Store full text for description use
                 product_data['_full_brand_model'] = brand_model_text
             
             # Extract reference number from h3 tag
-            reference_elem = product_element.find('h3')
-            if reference_elem:
-                product_data['reference'] = reference_elem.get_text(strip=True)
+            reference_elem = fields.get('reference')
+            if reference_elem is not None:
+                product_data['reference'] = _element_text(reference_elem)
             
             # Extract condition
-            condition_elem = product_element.find('div', class_='pre-owned-cus')
-            if condition_elem:
-                product_data['condition'] = condition_elem.get_text(strip=True)
+            condition_elem = fields.get('condition')
+            if condition_elem is not None:
+                product_data['condition'] = _element_text(condition_elem)
             
             # Extract price
-            price_elem = product_element.find('span', class_='woocommerce-Price-amount')
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
+            price_elem = fields.get('price')
+            if price_elem is not None:
+                price_text = _element_text(price_elem)
                 # Extract SGD price
-                price_match = re.search(r'SGD\s*([\d,]+)', price_text)
+                price_match = _PRICE_RE.search(price_text)
                 if price_match:
                     price_str = price_match.group(1).replace(',', '')
                     product_data['price_sgd'] = price_str
@@ -204,20 +399,30 @@ class WatchScraper:
         if not product_url:
             return detailed_info
         
-        soup = self.get_page(product_url)
-        if not soup:
-            return detailed_info
-        
         try:
+            response = self.fetch(product_url)
+            if response is None or not response.content:
+                return detailed_info
+            
+            # Unlike listing pages, raw bytes go straight to lexbor, which always reads them as UTF-8.
+            # Only ASCII markers and digits are read here, so any ASCII-compatible charset gives the
+            # same result, and this avoids running charset detection on every product page
+            tree = LexborHTMLParser(response.content)
+            
             # Extract year from "Date of Purchase" field first (priority approach)
-            purchase_date_section = soup.find('p', class_='singleproduct-inner-heading', string='Date of Purchase')
+            purchase_date_section = next(
+                (heading for heading in tree.css('p.singleproduct-inner-heading') if heading.text() == 'Date of Purchase'),
+                None,
+            )
             if purchase_date_section:
-                # Get the next sibling p tag that contains the date
-                date_value = purchase_date_section.find_next_sibling('p')
+                # Get the next sibling p tag that contains the date (skipping whitespace text nodes)
+                date_value = purchase_date_section.next
+                while date_value is not None and date_value.tag != 'p':
+                    date_value = date_value.next
                 if date_value:
-                    date_text = date_value.get_text(strip=True)
+                    date_text = date_value.text(strip=True)
                     # Extract 4-digit year from date text (e.g., "May 2024" -> 2024)
-                    year_match = re.search(r'(\d{4})', date_text)
+                    year_match = _YEAR4_RE.search(date_text)
                     if year_match:
                         year_int = int(year_match.group(1))
                         if 1950 <= year_int <= 2030:  # Reasonable year range for watches
@@ -226,50 +431,51 @@ class WatchScraper:
             # If no year from Date of Purchase, try other methods
             if not detailed_info['year']:
                 # Extract year from structured JSON-LD data
-                structured_data = soup.find_all('script', type='application/ld+json')
+                structured_data = tree.css('script[type="application/ld+json"]')
                 for script in structured_data:
+                    script_text = script.text()
+                    # Cheap substring checks skip JSON parsing for blocks that cannot yield a year
+                    if '"releaseDate"' not in script_text and '"description"' not in script_text:
+                        continue
+                    if not _YEAR4_RE.search(script_text):
+                        continue
                     try:
-                        if script.string:
-                            data = json.loads(script.string)
-                            if isinstance(data, dict):
-                                # Look for release date or manufacturing date
-                                if 'releaseDate' in data:
-                                    year_match = re.search(r'(\d{4})', str(data['releaseDate']))
-                                    if year_match:
-                                        year_int = int(year_match.group(1))
-                                        if 1950 <= year_int <= 2030:
-                                            detailed_info['year'] = year_int
-                                            break
-                                
-                                # Look for year in product description or name
-                                if 'description' in data:
-                                    year_match = re.search(r'(\d{4})', str(data['description']))
-                                    if year_match:
-                                        year_int = int(year_match.group(1))
-                                        if 1950 <= year_int <= 2030:
-                                            detailed_info['year'] = year_int
-                                            break
-                    except (json.JSONDecodeError, ValueError):
+                        data = _load_json(script_text)
+                        if isinstance(data, dict):
+                            # Look for release date or manufacturing date
+                            if 'releaseDate' in data:
+                                year_match = _YEAR4_RE.search(str(data['releaseDate']))
+                                if year_match:
+                                    year_int = int(year_match.group(1))
+                                    if 1950 <= year_int <= 2030:
+                                        detailed_info['year'] = year_int
+                                        break
+                            
+                            # Look for year in product description or name
+                            if 'description' in data:
+                                year_match = _YEAR4_RE.search(str(data['description']))
+                                if year_match:
+                                    year_int = int(year_match.group(1))
+                                    if 1950 <= year_int <= 2030:
+                                        detailed_info['year'] = year_int
+                                        break
+                    except json.JSONDecodeError:
                         continue
                 
                 # If still no year, search in page content for common year patterns
                 if not detailed_info['year']:
-                    page_text = soup.get_text()
-                    year_patterns = [
-                        r'Year[:\s]*(\d{4})',
-                        r'(\d{4})\s*model',
-                        r'circa\s*(\d{4})',
-                        r'manufactured\s*in\s*(\d{4})',
-                        r'production\s*year[:\s]*(\d{4})'
-                    ]
+                    page_text = ' '.join(elem.text(separator=' ', strip=True) for elem in tree.css(_YEAR_TEXT_SELECTOR))
+                    if not page_text and tree.body:
+                        # lexbor's text() includes script contents, so drop them first
+                        tree.strip_tags(['script', 'style'])
+                        page_text = tree.body.text(separator=' ', strip=True)
                     
-                    for pattern in year_patterns:
-                        year_match = re.search(pattern, page_text, re.IGNORECASE)
-                        if year_match:
-                            year_int = int(year_match.group(1))
-                            if 1950 <= year_int <= 2030:
-                                detailed_info['year'] = year_int
-                                break
+                    for year_match in _YEAR_CTX_RE.finditer(page_text):
+                        # Only the matching alternative's group participates
+                        year_int = int(year_match.group(year_match.lastindex))
+                        if 1950 <= year_int <= 2030:
+                            detailed_info['year'] = year_int
+                            break
             
             # For description, we'll set it in the main scraping function using the full brand model text
             # This is because we need access to the _full_brand_model field from basic info
@@ -279,46 +485,48 @@ class WatchScraper:
         
         return detailed_info
     
-    def scrape_page(self, page_num: int, include_details: bool = True) -> List[Dict]:
+    def scrape_page(self, page_num: int, include_details: bool = True,
+                    tree: Optional[lxml_html.HtmlElement] = None) -> List[Dict]:
         """
         Scrape a single page of products
         
         Args:
             page_num: Page number to scrape
             include_details: Whether to fetch detailed info from individual pages
+            tree: Already parsed listing page to reuse instead of fetching it
             
         Returns:
             List of product dictionaries
         """
-        if page_num == 1:
-            url = self.base_url
-        else:
-            url = f"{self.base_url}page/{page_num}/"
-        
-        soup = self.get_page(url)
-        if not soup:
+        if tree is None:
+            tree = self.get_listing_tree(page_num)
+        if tree is None:
             return []
         
         products = []
         
         # Find all product elements
-        product_elements = soup.find_all('li', class_='latest-single-product')
+        product_elements = _PRODUCT_XPATH(tree)
         
         logger.info(f"Found {len(product_elements)} products on page {page_num}")
         
-        for i, product_elem in enumerate(product_elements, 1):
-            try:
-                # Extract basic info
-                product_data = self.extract_product_basic_info(product_elem)
-                
-                if include_details and product_data.get('product_url'):
-                    # Add delay between requests
-                    time.sleep(self.delay)
-                    
-                    # Extract detailed info
-                    detailed_info = self.extract_product_detailed_info(product_data['product_url'])
+        # Extract basic info
+        basic_products = [self.extract_product_basic_info(product_elem) for product_elem in product_elements]
+        
+        if include_details:
+            # Fetch detail pages concurrently; the shared token bucket keeps the overall request rate at 1/delay
+            detail_targets = [product_data for product_data in basic_products if product_data.get('product_url')]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                detailed_infos = executor.map(self.extract_product_detailed_info,
+                                              [product_data['product_url'] for product_data in detail_targets])
+                for product_data, detailed_info in zip(detail_targets, detailed_infos):
                     product_data.update(detailed_info)
-                
+        
+        # One timestamp for the whole page; its products are scraped together
+        scraped_at = datetime.now().isoformat()
+        
+        for i, product_data in enumerate(basic_products, 1):
+            try:
                 # Set improved description using brand + series format (whether detailed info was extracted or not)
                 if product_data.get('_full_brand_model'):
                     product_data['description'] = product_data['_full_brand_model']
@@ -328,7 +536,7 @@ class WatchScraper:
                 # Add metadata
                 product_data.update({
                     'scraped_from': 'watchexchange.sg',
-                    'scraped_at': datetime.now().isoformat(),
+                    'scraped_at': scraped_at,
                     'product_type': 'watches'
                 })
                 
@@ -342,15 +550,19 @@ class WatchScraper:
         
         return products
     
-    def get_total_pages(self) -> int:
+    def get_total_pages(self, tree: Optional[lxml_html.HtmlElement] = None) -> int:
         """
         Get the total number of pages available
         
+        Args:
+            tree: Already parsed first listing page to reuse instead of fetching it
+            
         Returns:
             Total number of pages
         """
-        soup = self.get_page(self.base_url)
-        if not soup:
+        if tree is None:
+            tree = self.get_listing_tree(1)
+        if tree is None:
             return 1
         
         # Look for pagination info or load more button
@@ -358,18 +570,18 @@ class WatchScraper:
         # But let's try to extract it dynamically
         try:
             # Look for pagination or load more button
-            load_more_btn = soup.find('a', class_='lmp_button')
-            if load_more_btn:
-                href = load_more_btn.get('href', '')
-                page_match = re.search(r'/page/(\d+)/', href)
+            load_more_btns = _LOAD_MORE_XPATH(tree)
+            if load_more_btns:
+                href = load_more_btns[0].get('href', '')
+                page_match = _PAGE_RE.search(href)
                 if page_match:
                     return int(page_match.group(1))
             
             # Look for result count to estimate pages
-            result_count_elem = soup.find('h1', class_='woocommerce-result-count')
-            if result_count_elem:
-                count_text = result_count_elem.get_text()
-                count_match = re.search(r'(\d+)\s*Pre-owned watches', count_text)
+            result_count_elems = _RESULT_COUNT_XPATH(tree)
+            if result_count_elems:
+                count_text = result_count_elems[0].text_content()
+                count_match = _COUNT_RE.search(count_text)
                 if count_match:
                     total_products = int(count_match.group(1))
                     # Assuming 20 products per page
@@ -380,29 +592,60 @@ class WatchScraper:
         # Default fallback
         return 27
     
-    def scrape_all_pages(self, include_details: bool = True) -> List[Dict]:
+    def iter_all_pages(self, include_details: bool = True) -> Iterator[List[Dict]]:
         """
-        Scrape all available pages
+        Scrape all available pages, yielding each page's products as soon as it is done
         
         Args:
             include_details: Whether to fetch detailed info from individual pages
             
-        Returns:
-            List of all product dictionaries
+        Yields:
+            List of product dictionaries for one page
         """
-        total_pages = self.get_total_pages()
+        # Page 1 serves both pagination and its own products, so it is fetched once per crawl
+        first_page_tree = self.get_listing_tree(1)
+        total_pages = self.get_total_pages(first_page_tree)
         logger.info(f"Starting to scrape {total_pages} pages")
         
-        all_products = []
-        
         for page_num in range(1, total_pages + 1):
             logger.info(f"Scraping page {page_num}/{total_pages}")
-            products = self.scrape_page(page_num, include_details)
-            all_products.extend(products)
+            if page_num == 1:
+                yield self.scrape_page(page_num, include_details, tree=first_page_tree)
+                first_page_tree = None
+            else:
+                yield self.scrape_page(page_num, include_details)
+    
+    def iter_page_range(self, start_page: int, end_page: int, include_details: bool = True) -> Iterator[List[Dict]]:
+        """
+        Scrape a range of pages, yielding each page's products as soon as it is done
+        
+        Args:
+            start_page: Starting page number
+            end_page: Ending page number (inclusive)
+            include_details: Whether to fetch detailed info from individual pages
             
-            # Add delay between pages
-            time.sleep(self.delay)
+        Yields:
+            List of product dictionaries for one page
+        """
+        logger.info(f"Scraping pages {start_page} to {end_page}")
+        
+        for page_num in range(start_page, end_page + 1):
+            logger.info(f"Scraping page {page_num}")
+            yield self.scrape_page(page_num, include_details)
+    
+    def scrape_all_pages(self, include_details: bool = True) -> List[Dict]:
+        """
+        Scrape all available pages
         
+        Args:
+            include_details: Whether to fetch detailed info from individual pages
+            
+        Returns:
+            List of all product dictionaries
+        """
+        all_products = []
+        for products in self.iter_all_pages(include_details):
+            all_products.extend(products)
         return all_products
     
     def scrape_page_range(self, start_page: int, end_page: int, include_details: bool = True) -> List[Dict]:
@@ -417,18 +660,9 @@ class WatchScraper:
         Returns:
             List of product dictionaries
         """
-        logger.info(f"Scraping pages {start_page} to {end_page}")
-        
         all_products = []
-        
-        for page_num in range(start_page, end_page + 1):
-            logger.info(f"Scraping page {page_num}")
-            products = self.scrape_page(page_num, include_details)
+        for products in self.iter_page_range(start_page, end_page, include_details):
             all_products.extend(products)
-            
-            # Add delay between pages
-            time.sleep(self.delay)
-        
         return all_products
 
 def main():
@@ -445,37 +679,58 @@ def main():
     parser.add_argument('--output', '-o', required=True, help='Output JSON filename')
     parser.add_argument('--delay', type=float, default=1.0, help='Delay between requests in seconds (default: 1.0)')
     parser.add_argument('--no-details', action='store_true', help='Skip detailed info extraction (faster)')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent product detail requests (default: 8)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the on-disk response cache (wx_cache.sqlite)')
     
     args = parser.parse_args()
     
     # Initialize scraper
-    scraper = WatchScraper(delay=args.delay)
+    scraper = WatchScraper(delay=args.delay, max_workers=args.workers,
+                           cache_name=None if args.no_cache else 'wx_cache')
     
     # Determine what to scrape
     include_details = not args.no_details
     
     if args.all:
         logger.info("Scraping all pages...")
-        products = scraper.scrape_all_pages(include_details)
+        page_batches = scraper.iter_all_pages(include_details)
     elif args.pages:
         start_page, end_page = args.pages
         logger.info(f"Scraping pages {start_page} to {end_page}...")
-        products = scraper.scrape_page_range(start_page, end_page, include_details)
+        page_batches = scraper.iter_page_range(start_page, end_page, include_details)
     elif args.page:
         logger.info(f"Scraping page {args.page}...")
-        products = scraper.scrape_page(args.page, include_details)
+        page_batches = [scraper.scrape_page(args.page, include_details)]
     
-    # Save to JSON
-    logger.info(f"Saving {len(products)} products to {args.output}")
+    # Stream to JSON one product per line, flushing after every page so only one page is held
+    # in memory and a crash leaves everything scraped so far on disk
+    logger.info(f"Saving products to {args.output}")
     
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(products, f, indent=2, ensure_ascii=False)
+    product_count = 0
+    sample_product = None
+    completed = False
+    with open(args.output, 'wb') as f:
+        f.write(b'[')
+        try:
+            for products in page_batches:
+                for product in products:
+                    # Separator and object go out in one write so an interrupt can't leave a dangling comma
+                    f.write((b',\n' if product_count else b'\n') + orjson.dumps(product))
+                    product_count += 1
+                if sample_product is None and products:
+                    sample_product = products[0]
+                f.flush()
+            completed = True
+        finally:
+            # Always close the array so a crashed or interrupted crawl still leaves valid JSON
+            f.write(b'\n]\n')
+            if not completed:
+                logger.error(f"Scrape interrupted; saved {product_count} products to {args.output}")
     
-    logger.info(f"Successfully saved {len(products)} products to {args.output}")
+    logger.info(f"Successfully saved {product_count} products to {args.output}")
     
     # Print summary
-    if products:
-        sample_product = products[0]
+    if sample_product:
         logger.info("Sample product structure:")
         for key, value in sample_product.items():
             logger.info(f"  {key}: {value}")